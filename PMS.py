@@ -1,40 +1,231 @@
 import sys
+import asyncio
+import functools
 import subprocess
 import time
 import os
-from dataclasses import dataclass
+import ipaddress
+import socket
+import struct
+import threading
+from array import array
 from typing import List
 
 try:
     from PyQt5.QtWidgets import (
         QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-        QLineEdit, QLabel, QTableWidget, QTableWidgetItem, QMessageBox,
+        QLineEdit, QLabel, QTableView, QMessageBox,
         QHeaderView, QSpinBox, QDialog, QFormLayout, QAbstractItemView,
-        QComboBox, QMainWindow, QSizePolicy
+        QComboBox, QMainWindow, QSizePolicy, QStyledItemDelegate, QToolTip
     )
-    from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal, QThread
-    from PyQt5.QtGui import QIcon, QPixmap, QColor, QFont
+    from PyQt5.QtCore import (
+        Qt, QTimer, QObject, pyqtSignal, QEvent, QRect,
+        QAbstractTableModel, QModelIndex
+    )
+    from PyQt5.QtGui import QIcon, QPixmap, QColor, QFont, QBrush
 except ModuleNotFoundError:
     print("PyQt5 is not installed. Please install it using:")
     print("    pip install PyQt5")
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     if hasattr(sys, "_MEIPASS"):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
 
-@dataclass
-class Device:
-    ip: str
-    name: str
-    success: int = 0
-    fail: int = 0
-    total: int = 0
-    last_result: bool = False
-    is_active: bool = True
+@functools.lru_cache(maxsize=None)
+def cached_icon(relative_path):
+    return QIcon(resource_path(relative_path))
+
+
+@functools.lru_cache(maxsize=None)
+def cached_pixmap(relative_path, size):
+    # Decoded and scaled once per process; needs a QApplication to exist
+    pixmap = QPixmap(resource_path(relative_path))
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+INPUT_STYLE = """
+    padding: 6px;
+    border: 2px solid #0078d7;
+    border-radius: 6px;
+    background-color: #e6f0fb;
+    font-weight: bold;
+"""
+START_BUTTON_STYLE = "background-color: #28a745; color: white; padding: 8px; border-radius: 6px;"
+STOP_BUTTON_STYLE = "background-color: #dc3545; color: white; padding: 8px; border-radius: 6px;"
+
+# Gap between ping process launches, so a burst doesn't overrun the kernel
+PING_SPAWN_STAGGER = 0.01
+# Headroom over a ping's own timeout before the sweep budget cuts it off
+SWEEP_BUDGET_SLACK = 0.5
+
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+
+
+def icmp_checksum(data):
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class DeviceStore:
+    # Device fields are kept in parallel arrays, one entry per device
+    def __init__(self):
+        self.names: List[str] = []
+        # What the user entered, and the numeric address it resolved to on add
+        self.hosts: List[str] = []
+        self.ips: List[str] = []
+        # Stable per-device ids, so results can be matched after rows shift
+        self.ids = array("Q")
+        self._next_id = 0
+        self.success = array("Q")
+        self.fail = array("Q")
+        self.total = array("Q")
+        self.last_result = bytearray()
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, host: str, ip: str, name: str):
+        self.names.append(name)
+        self.hosts.append(host)
+        self.ips.append(ip)
+        self.ids.append(self._next_id)
+        self._next_id += 1
+        self.success.append(0)
+        self.fail.append(0)
+        self.total.append(0)
+        self.last_result.append(0)
+
+    def remove(self, index: int):
+        del self.names[index]
+        del self.hosts[index]
+        del self.ips[index]
+        del self.ids[index]
+        del self.success[index]
+        del self.fail[index]
+        del self.total[index]
+        del self.last_result[index]
+
+    def record(self, index: int, alive: bool):
+        self.total[index] += 1
+        if alive:
+            self.success[index] += 1
+        else:
+            self.fail[index] += 1
+        self.last_result[index] = alive
+
+    def clear_stats(self):
+        zeros = array("Q", [0]) * len(self.names)
+        self.success[:] = zeros
+        self.fail[:] = zeros
+        self.total[:] = zeros
+
+
+class DeviceModel(QAbstractTableModel):
+    HEADERS = ["Name", "IP", "Success", "Fail", "Total", ""]
+    BRUSH_WHITE = QBrush(QColor("#ffffff"))
+    BRUSH_GREEN = QBrush(QColor("#00c853"))
+    BRUSH_RED = QBrush(QColor("#d50000"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = DeviceStore()
+        # last_result as of the latest notification, to skip unchanged backgrounds
+        self._painted = bytearray()
+        self.highlight = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row, col = index.row(), index.column()
+        store = self.store
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return store.names[row]
+            if col == 1:
+                return store.hosts[row]
+            if col == 2:
+                return str(store.success[row])
+            if col == 3:
+                return str(store.fail[row])
+            if col == 4:
+                return str(store.total[row])
+        elif role == Qt.UserRole:
+            # Raw values for sorting and comparisons, without parsing display text
+            if col == 0:
+                return store.names[row]
+            if col == 1:
+                return store.hosts[row]
+            if col == 2:
+                return store.success[row]
+            if col == 3:
+                return store.fail[row]
+            if col == 4:
+                return store.total[row]
+        elif role == Qt.BackgroundRole and col < 5:
+            if not self.highlight:
+                return self.BRUSH_WHITE
+            return self.BRUSH_GREEN if store.last_result[row] else self.BRUSH_RED
+        return None
+
+    def add_device(self, host: str, ip: str, name: str):
+        row = len(self.store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.store.append(host, ip, name)
+        self._painted.append(0)
+        self.endInsertRows()
+
+    def remove_device(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.store.remove(row)
+        del self._painted[row]
+        self.endRemoveRows()
+
+    def record_result(self, row: int, alive: bool):
+        self.store.record(row, alive)
+
+    def notify_row(self, row: int):
+        if self._painted[row] == self.store.last_result[row]:
+            # Only the counters moved
+            self.dataChanged.emit(self.index(row, 2), self.index(row, 4), [Qt.DisplayRole])
+            return
+        self._painted[row] = self.store.last_result[row]
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 4), [Qt.DisplayRole, Qt.BackgroundRole])
+
+    def clear_stats(self):
+        self.store.clear_stats()
+        if self.store:
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self.store) - 1, 4), [Qt.DisplayRole])
+
+    def set_highlight(self, highlight: bool):
+        self.highlight = highlight
+        self._painted[:] = self.store.last_result
+        if self.store:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.store) - 1, 4), [Qt.BackgroundRole])
+
+    def refresh(self):
+        self._painted[:] = self.store.last_result
+        if self.store:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.store) - 1, 4),
+                                  [Qt.DisplayRole, Qt.BackgroundRole])
 
 
 class SettingsDialog(QDialog):
@@ -59,6 +250,12 @@ class SettingsDialog(QDialog):
         self.interface_input.setText(parent.interface_name)
         layout.addRow("Network Interface:", self.interface_input)
 
+        self.max_concurrent_spin = QSpinBox()
+        self.max_concurrent_spin.setMinimum(1)
+        self.max_concurrent_spin.setMaximum(1024)
+        self.max_concurrent_spin.setValue(parent.max_concurrent)
+        layout.addRow("Max Concurrent Pings:", self.max_concurrent_spin)
+
         btn = QPushButton("Save")
         btn.clicked.connect(self.accept)
         layout.addWidget(btn)
@@ -72,40 +269,275 @@ class SettingsDialog(QDialog):
     def get_interface(self):
         return self.interface_input.text().strip()
 
+    def get_max_concurrent(self):
+        return self.max_concurrent_spin.value()
+
+
+class TrashDelegate(QStyledItemDelegate):
+    remove_requested = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._icon = cached_icon("icons/trash.ico")
+
+    def paint(self, painter, option, index):
+        icon_rect = QRect(0, 0, 16, 16)
+        icon_rect.moveCenter(option.rect.center())
+        self._icon.paint(painter, icon_rect)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self.remove_requested.emit(index.row())
+            return True
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            QToolTip.showText(event.globalPos(), "Remove this device", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
 
 class PingWorker(QObject):
     finished = pyqtSignal()
-    update_device = pyqtSignal(int, Device)
+    # One [(index, alive), ...] batch per sweep
+    updates_ready = pyqtSignal(list)
+    # Set once the process turns out to lack ICMP socket permissions, so later
+    # sweeps go straight to the ping binary
+    icmp_denied = False
 
-    def __init__(self, devices, interface_name, timeout):
+    def __init__(self):
         super().__init__()
-        self.devices = devices
+        self.ips = []
+        self.interface_name = ""
+        self.timeout = 1000
+        self.max_concurrent = 64
+        self.interval = 1
+        # Where the next fallback sweep starts, so pings cut off by the sweep
+        # budget go first next time
+        self._fallback_offset = 0
+        # Kept open between sweeps and reopened when the interface changes
+        self._sock = None
+        self._sock_interface = None
+        # One event loop serves every sweep from a long-lived background thread;
+        # signals emitted there are queued to the GUI thread
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+    def request_sweep(self, ips, interface_name, timeout, max_concurrent, interval):
+        if self.loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(
+            self.run(ips, interface_name, timeout, max_concurrent, interval), self.loop
+        )
+
+    def shutdown(self):
+        asyncio.run_coroutine_threadsafe(self._cancel_sweeps(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+        self._close_socket()
+
+    async def _cancel_sweeps(self):
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, ips, interface_name, timeout, max_concurrent, interval):
+        self.ips = ips
         self.interface_name = interface_name
         self.timeout = timeout
-
-    def run(self):
-        timeout_sec = max(1, int(self.timeout / 1000))
-        for index, device in enumerate(self.devices):
+        self.max_concurrent = max_concurrent
+        self.interval = interval
+        results = []
+        try:
+            results = await self._sweep(self._icmp_socket())
+        finally:
+            self.updates_ready.emit(results)
+            self.finished.emit()
+
+    def _icmp_socket(self):
+        if self._sock is not None and self._sock_interface == self.interface_name:
+            return self._sock
+        self._close_socket()
+        if not PingWorker.icmp_denied:
             try:
-                result = subprocess.run(
-                    ["ping", "-I", self.interface_name, "-c", "1", "-W", str(timeout_sec), device.ip],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=timeout_sec + 1
-                )
-                device.total += 1
-                if result.returncode == 0:
-                    device.success += 1
-                    device.last_result = True
-                else:
-                    device.fail += 1
-                    device.last_result = False
-            except Exception:
-                device.fail += 1
-                device.total += 1
-                device.last_result = False
-            self.update_device.emit(index, device)
-        self.finished.emit()
+                self._sock = self._open_icmp_socket()
+                self._sock_interface = self.interface_name
+            except PermissionError:
+                PingWorker.icmp_denied = True
+            except (OSError, AttributeError):
+                pass
+        return self._sock
+
+    def _close_socket(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _open_icmp_socket(self):
+        try:
+            # Unprivileged ICMP, allowed by net.ipv4.ping_group_range on Linux
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except PermissionError:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+        try:
+            if self.interface_name:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, self.interface_name.encode() + b"\0")
+            sock.setblocking(False)
+        except (OSError, AttributeError):
+            sock.close()
+            raise
+        return sock
+
+    async def _sweep(self, sock):
+        if sock is None:
+            # No ICMP socket permission or SO_BINDTODEVICE support: use the ping binary
+            return await self._ping_all(list(enumerate(self.ips)))
+        ident = os.getpid() & 0xFFFF
+        # Replies still queued from earlier sweeps carry another token and are dropped
+        token = struct.unpack("!I", os.urandom(4))[0]
+        pending, leftovers = await self._send_echoes(sock, ident, token)
+        # Hosts the ICMP socket could not send to are pinged while its replies come in
+        icmp_results, ping_results = await asyncio.gather(
+            self._collect_replies(sock, ident, token, pending),
+            self._ping_all(leftovers)
+        )
+        return icmp_results + ping_results
+
+    async def _send_echoes(self, sock, ident, token):
+        # Returns the indexes awaiting a reply and the (index, ip) pairs the ICMP
+        # socket cannot address
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout / 1000
+        pending = set()
+        leftovers = []
+        for index, ip in enumerate(self.ips):
+            payload = struct.pack("!II", token, index)
+            header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, ident, index & 0xFFFF)
+            checksum = icmp_checksum(header + payload)
+            header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, ident, index & 0xFFFF)
+            try:
+                while True:
+                    try:
+                        sock.sendto(header + payload, (ip, 0))
+                        break
+                    except BlockingIOError:
+                        # Send buffer is full, e.g. echoes queued behind unresolved ARP
+                        # neighbours; wait for room rather than forking ping
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            raise asyncio.TimeoutError
+                        await asyncio.wait_for(self._wait_writable(sock), timeout=remaining)
+            except asyncio.TimeoutError:
+                # Never sent, so it reports nothing rather than a failure, like
+                # fallback pings cut off by the sweep budget
+                continue
+            except OSError:
+                leftovers.append((index, ip))
+                continue
+            pending.add(index)
+        return pending, leftovers
+
+    async def _wait_writable(self, sock):
+        # loop.sock_sendto only exists on Python 3.11+
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        loop.add_writer(sock, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_writer(sock)
+
+    async def _collect_replies(self, sock, ident, token, pending):
+        loop = asyncio.get_running_loop()
+        raw = sock.type == socket.SOCK_RAW
+        results = []
+        deadline = loop.time() + self.timeout / 1000
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                data = await asyncio.wait_for(loop.sock_recv(sock, 1024), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            except OSError:
+                continue
+            if raw:
+                # Raw sockets deliver the IP header too
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 16:
+                continue
+            icmp_type, _, _, reply_ident, _ = struct.unpack("!BBHHH", data[:8])
+            # The kernel rewrites the identifier on unprivileged sockets
+            if icmp_type != ICMP_ECHO_REPLY or (raw and reply_ident != ident):
+                continue
+            reply_token, index = struct.unpack("!II", data[8:16])
+            if reply_token == token and index in pending:
+                pending.discard(index)
+                results.append((index, True))
+
+        results.extend((index, False) for index in pending)
+        return results
+
+    async def _ping_all(self, targets):
+        if not targets:
+            return []
+        timeout_sec = max(1, int(self.timeout / 1000))
+        argv_prefix = ("ping", "-c", "1", "-W", str(timeout_sec))
+        # Same rule as the ICMP socket: only bind when an interface is configured
+        if self.interface_name:
+            argv_prefix += ("-I", self.interface_name)
+        # Caps live ping processes (and their pipes) however many devices there are
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        spawn_lock = asyncio.Lock()
+        offset = self._fallback_offset % len(targets)
+        targets = targets[offset:] + targets[:offset]
+        tasks = [
+            asyncio.ensure_future(self._ping_one(index, ip, argv_prefix, timeout_sec, semaphore, spawn_lock))
+            for index, ip in targets
+        ]
+        # Sweep budget: one ping interval, or one ping window if that is longer
+        budget = max(self.interval, timeout_sec + 1) + SWEEP_BUDGET_SLACK
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        # Resume at the first ping, in launch order, that did not finish; faster
+        # replies launched after it must not push the offset past it
+        self._fallback_offset = offset + next(
+            (position for position, task in enumerate(tasks) if task not in done), len(tasks)
+        )
+        # Pings cut off by the budget report nothing rather than a failure; most
+        # were only waiting for a concurrency slot
+        return [task.result() for task in tasks if task in done]
+
+    async def _ping_one(self, index, ip, argv_prefix, timeout_sec, semaphore, spawn_lock):
+        proc = None
+        try:
+            async with semaphore:
+                async with spawn_lock:
+                    proc = await asyncio.create_subprocess_exec(
+                        *argv_prefix, ip,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
+                    )
+                    await asyncio.sleep(PING_SPAWN_STAGGER)
+                returncode = await asyncio.wait_for(proc.wait(), timeout=timeout_sec + 1)
+            return index, returncode == 0
+        except Exception:
+            return index, False
+        finally:
+            # Timed out or cancelled by the sweep budget
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                # Reap it here so the child never outlives its loop; shielded so
+                # a second cancellation can't skip the wait
+                await asyncio.shield(proc.wait())
 
 
 class PingMonitor(QWidget):
@@ -113,15 +545,36 @@ class PingMonitor(QWidget):
         super().__init__()
         self.setWindowTitle("PMS")
         self.setStyleSheet("background-color: #f0f4f8;")
-        self.devices: List[Device] = []
+        self.model = DeviceModel(self)
         self.ping_interval = 1
         self.ping_timeout = 1000
         self.interface_name = "enp3s0"
+        self.max_concurrent = 64
         self.running = False
+        # Single-shot: re-armed when a sweep finishes, so sweeps never pile up
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.ping_all)
+        self._sweep_started = 0.0
+        self._sweep_inflight = False
+        # Device ids in the order the worker was given them
+        self._sweep_ids = array("Q")
         self.unnamed_count = 0
         self.toggle_btn = None
+        # Set when results arrive while the window is hidden or minimized
+        self._dirty = False
+        # Ids of devices with results not yet shown; flushed together by _flush_timer.
+        # Ids, not rows, so a removal before the flush can't shift them
+        self._pending = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        self.worker = PingWorker()
+        self.worker.updates_ready.connect(self.apply_results)
+        self.worker.finished.connect(self.sweep_finished)
 
         self.init_ui()
 
@@ -134,8 +587,7 @@ class PingMonitor(QWidget):
 
         # Sol: icon
         icon_label = QLabel()
-        pixmap = QPixmap(resource_path("icons/ping-pong.ico"))
-        icon_label.setPixmap(pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        icon_label.setPixmap(cached_pixmap("icons/ping-pong.ico", 40))
         icon_label.setAlignment(Qt.AlignCenter)
         icon_label.setFixedWidth(50)  # sabit genişlik
         top_layout.addWidget(icon_label)
@@ -145,27 +597,15 @@ class PingMonitor(QWidget):
         top_layout.addLayout(left_inputs_layout)
 
         self.ip_input = QLineEdit()
-        self.ip_input.setPlaceholderText("IP address")
+        self.ip_input.setPlaceholderText("IP address or host")
         self.ip_input.setFixedWidth(150)
-        self.ip_input.setStyleSheet("""
-            padding: 6px;
-            border: 2px solid #0078d7;
-            border-radius: 6px;
-            background-color: #e6f0fb;
-            font-weight: bold;
-        """)
+        self.ip_input.setStyleSheet(INPUT_STYLE)
         left_inputs_layout.addWidget(self.ip_input)
 
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Device Name (optional)")
         self.name_input.setFixedWidth(150)
-        self.name_input.setStyleSheet("""
-            padding: 6px;
-            border: 2px solid #0078d7;
-            border-radius: 6px;
-            background-color: #e6f0fb;
-            font-weight: bold;
-        """)
+        self.name_input.setStyleSheet(INPUT_STYLE)
         left_inputs_layout.addWidget(self.name_input)
 
         add_btn = QPushButton("Add")
@@ -205,14 +645,18 @@ class PingMonitor(QWidget):
         right_btns_layout.addWidget(settings_btn)
 
         # Tablo aynı kaldı
-        self.table = QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels(["Name", "IP", "Success", "Fail", "Total", ""])
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setDefaultSectionSize(30)
         self.table.verticalHeader().setFixedWidth(60)
         self.table.setSortingEnabled(False)
-        self.table.setStyleSheet("QTableWidget { background-color: white; border: 1px solid #ccc; font-size: 14px; }")
+        self.table.setStyleSheet("QTableView { background-color: white; border: 1px solid #ccc; font-size: 14px; }")
+        trash_delegate = TrashDelegate(self.table)
+        # Queued so the row is removed after the view finishes handling the click
+        trash_delegate.remove_requested.connect(self.remove_device, Qt.QueuedConnection)
+        self.table.setItemDelegateForColumn(5, trash_delegate)
         main_layout.addWidget(self.table)
 
 
@@ -224,99 +668,125 @@ class PingMonitor(QWidget):
 
     def start(self):
         self.running = True
+        self.model.set_highlight(True)
         self.timer.start(self.ping_interval * 1000)
         self.toggle_btn.setText("Stop")
-        self.toggle_btn.setStyleSheet("background-color: #dc3545; color: white; padding: 8px; border-radius: 6px;")
+        self.toggle_btn.setStyleSheet(STOP_BUTTON_STYLE)
 
     def stop(self):
         self.running = False
         self.timer.stop()
-        self.refresh_table()
+        self.model.set_highlight(False)
         self.toggle_btn.setText("Start")
-        self.toggle_btn.setStyleSheet("background-color: #28a745; color: white; padding: 8px; border-radius: 6px;")
+        self.toggle_btn.setStyleSheet(START_BUTTON_STYLE)
 
-    def add_device(self, ip: str, name: str):
-        if not ip:
+    def add_device(self, host: str, name: str):
+        host = host.strip()
+        if not host:
             QMessageBox.warning(self, "Missing Info", "Please enter an IP address.")
             return
+        try:
+            host = ip = str(ipaddress.ip_address(host))
+        except ValueError:
+            # Resolve host names once here so sweeps never hit DNS
+            try:
+                infos = socket.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+            except (socket.gaierror, UnicodeError):
+                QMessageBox.warning(self, "Invalid IP", f"'{host}' is not a valid IP address or host name.")
+                return
+            # The ICMP socket is IPv4, so prefer an IPv4 address
+            infos.sort(key=lambda info: info[0] != socket.AF_INET)
+            ip = infos[0][4][0]
         if not name.strip():
             self.unnamed_count += 1
             name = f"Switch{self.unnamed_count}"
-        self.devices.append(Device(ip=ip, name=name))
+        self.model.add_device(host, ip, name)
         self.ip_input.clear()
         self.name_input.clear()
-        self.refresh_table()
 
     def remove_device(self, index: int):
-        if 0 <= index < len(self.devices):
-            del self.devices[index]
-            self.refresh_table()
-
-    def refresh_table(self):
-        scroll_pos = self.table.verticalScrollBar().value()
-        self.table.setRowCount(len(self.devices))
-        for idx, device in enumerate(self.devices):
-            self.table.setItem(idx, 0, QTableWidgetItem(device.name))
-            self.table.setItem(idx, 1, QTableWidgetItem(device.ip))
-            self.table.setItem(idx, 2, QTableWidgetItem(str(device.success)))
-            self.table.setItem(idx, 3, QTableWidgetItem(str(device.fail)))
-            self.table.setItem(idx, 4, QTableWidgetItem(str(device.total)))
-
-            remove_btn = QPushButton()
-            remove_btn.setIcon(QIcon(resource_path("icons/trash.ico")))
-            remove_btn.setToolTip("Remove this device")
-            remove_btn.setStyleSheet("border: none; background: none; padding: 2px;")
-            remove_btn.clicked.connect(lambda _, i=idx: self.remove_device(i))
-            self.table.setCellWidget(idx, 5, remove_btn)
-
-            self.color_row(idx, device)
-
-        self.table.verticalScrollBar().setValue(scroll_pos)
-
-    def color_row(self, row: int, device: Device):
-        if self.running:
-            color = QColor("#00c853") if device.last_result else QColor("#d50000")
-        else:
-            color = QColor("#ffffff")
-        for col in range(self.table.columnCount() - 1):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(color)
+        if 0 <= index < self.model.rowCount():
+            self.model.remove_device(index)
 
     def clear_stats(self):
-        for device in self.devices:
-            device.success = device.fail = device.total = 0
-        self.refresh_table()
+        self.model.clear_stats()
 
     def open_settings(self):
         dialog = SettingsDialog(self)
         if dialog.exec_():
             self.ping_interval = dialog.get_interval()
             self.ping_timeout = dialog.get_timeout()
+            self.max_concurrent = dialog.get_max_concurrent()
             iface = dialog.get_interface()
             if iface:
                 self.interface_name = iface
-            if self.running:
+            # While a sweep is in flight the timer is re-armed when it finishes
+            if self.running and self.timer.isActive():
                 self.timer.start(self.ping_interval * 1000)
 
     def ping_all(self):
-        self.thread = QThread()
-        self.worker = PingWorker(self.devices, self.interface_name, self.ping_timeout)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.update_device.connect(self.update_device_row)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.thread.start()
-
-    def update_device_row(self, index, device):
-        self.color_row(index, device)
-        self.table.item(index, 2).setText(str(device.success))
-        self.table.item(index, 3).setText(str(device.fail))
-        self.table.item(index, 4).setText(str(device.total))
+        # A Stop/Start during a sweep can arm the timer early; sweep_finished re-arms it
+        if self._sweep_inflight:
+            return
+        self._sweep_inflight = True
+        self._sweep_started = time.monotonic()
+        # The worker only ever sees this snapshot; the model stays GUI-thread only
+        self._sweep_ids = array("Q", self.model.store.ids)
+        self.worker.request_sweep(list(self.model.store.ips), self.interface_name, self.ping_timeout,
+                                  self.max_concurrent, self.ping_interval)
+
+    def sweep_finished(self):
+        self._sweep_inflight = False
+        if self.running:
+            elapsed_ms = int((time.monotonic() - self._sweep_started) * 1000)
+            self.timer.start(max(0, self.ping_interval * 1000 - elapsed_ms))
+
+    def closeEvent(self, event):
+        # The cancelled sweep still emits finished; sweep_finished must not re-arm
+        self.running = False
+        self.timer.stop()
+        self.worker.shutdown()
+        super().closeEvent(event)
+
+    def apply_results(self, results):
+        ids, store_ids = self._sweep_ids, self.model.store.ids
+        if store_ids[:len(ids)] != ids:
+            # Devices were removed mid-sweep; map snapshot positions to current rows
+            row_of = {device_id: row for row, device_id in enumerate(store_ids)}
+            results = [(row_of[ids[index]], alive) for index, alive in results if ids[index] in row_of]
+        row_count = self.model.rowCount()
+        for index, alive in results:
+            if index < row_count:
+                self.model.record_result(index, alive)
+        if not self.isVisible() or self.isMinimized():
+            self._dirty = True
+            return
+        self._pending.update(store_ids[index] for index, _ in results if index < row_count)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        device_ids, self._pending = self._pending, set()
+        # Qt merges the dataChanged updates into one paint; wrapping them in
+        # setUpdatesEnabled would repaint the whole table instead
+        for row, device_id in enumerate(self.model.store.ids):
+            if device_id in device_ids:
+                self.model.notify_row(row)
+
+    def flush_dirty(self):
+        if self._dirty:
+            self._dirty = False
+            self._pending.clear()
+            self.model.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.flush_dirty()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.flush_dirty()
 
 
 def main():
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import PMS  # noqa: E402
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    app = PMS.QApplication.instance() or PMS.QApplication([])
+    win = PMS.PingMonitor()
+    # Results are fed to apply_results by hand; no real sweep runs
+    monkeypatch.setattr(win.worker, "request_sweep", lambda *args: None)
+    win.show()
+    app.processEvents()
+    for index in range(3):
+        win.add_device(f"10.0.0.{index + 1}", f"Device{index}")
+    yield win
+    win.close()
+
+
+def test_results_follow_ids_when_a_device_is_removed_mid_sweep(monitor):
+    store = monitor.model.store
+    monitor.ping_all()
+    # Device 1 is removed while the sweep is in flight
+    monitor.remove_device(1)
+
+    monitor.apply_results([(0, True), (1, False), (2, False)])
+
+    assert list(store.ids) == [0, 2]
+    assert list(store.success) == [1, 0]
+    assert list(store.fail) == [0, 1]
+    assert list(store.total) == [1, 1]
+
+
+def test_flush_notifies_current_rows_after_a_removal(monitor):
+    store = monitor.model.store
+    notified = []
+    monitor.model.dataChanged.connect(lambda top_left, *args: notified.append(top_left.row()))
+    monitor.ping_all()
+    # Device 1 got no reply in time, so only devices 0 and 2 have results
+    monitor.apply_results([(0, True), (2, False)])
+    # Device 0 is removed before the coalesced flush runs
+    monitor.remove_device(0)
+
+    monitor._flush_timer.stop()
+    monitor._flush_pending()
+
+    assert list(store.ids) == [1, 2]
+    # Only device 2, now at row 1, is repainted; device 1 at row 0 is not
+    assert notified == [1]
+    assert not monitor._pending
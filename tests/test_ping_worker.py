@@ -0,0 +1,49 @@
+import asyncio
+import os
+import stat
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import PMS  # noqa: E402
+
+# The last argument is the target; two slow hosts hold both slots, then the
+# dead host is launched late enough that the sweep budget cuts it off
+STUB_PING = """#!/bin/sh
+for arg in "$@"; do target=$arg; done
+case $target in
+  10.0.0.1|10.0.0.2) sleep 0.8; exit 0;;
+  10.0.0.3) exec sleep 10;;
+  *) exit 0;;
+esac
+"""
+
+
+@pytest.fixture
+def stub_ping(tmp_path, monkeypatch):
+    ping = tmp_path / "ping"
+    ping.write_text(STUB_PING)
+    ping.chmod(ping.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_fallback_offset_stops_at_first_unfinished_ping(stub_ping):
+    worker = PMS.PingWorker()
+    try:
+        worker.interface_name = ""
+        worker.timeout = 1000
+        worker.max_concurrent = 2
+        worker.interval = 1
+        targets = [(index, f"10.0.0.{index + 1}") for index in range(8)]
+
+        # Same loop the sweeps run on in the app
+        results = asyncio.run_coroutine_threadsafe(worker._ping_all(targets), worker.loop).result(timeout=10)
+
+        # The dead host was cut off while later, faster hosts finished
+        assert sorted(index for index, _ in results) == [0, 1, 3, 4, 5, 6, 7]
+        assert worker._fallback_offset == 2
+    finally:
+        worker.shutdown()